@@ -4,13 +4,15 @@
 from PIL import Image
 import os
 
+from logo_utils import LOGO_DIR, REFERENCE_PATH, save_png
+
 # Load reference
-ref_path = "/System/Volumes/Data/Users/iheanyi/Downloads/grove.jpg"
+ref_path = REFERENCE_PATH
 ref = Image.open(ref_path)
 
 # Load our version
-our_path = "/Users/iheanyi/development/grove/docs/logo/grove-dock-v2-comparison.png"
-our = Image.open(our_path)
+our_path = os.path.join(LOGO_DIR, "grove-dock-v2-comparison.png")
+our = Image.open(our_path).convert('RGB')
 
 # Create comparison
 # Reference is wider, let's make them similar heights
@@ -18,7 +20,10 @@ target_h = 400
 
 ref_ratio = ref.width / ref.height
 ref_new_w = int(target_h * ref_ratio)
-ref_resized = ref.resize((ref_new_w, target_h), Image.Resampling.LANCZOS)
+# Let the JPEG decoder scale down by a power of two while decoding, staying
+# at least 2x the target so LANCZOS still does the final filtering
+ref.draft('RGB', (ref_new_w * 2, target_h * 2))
+ref_resized = ref.convert('RGB').resize((ref_new_w, target_h), Image.Resampling.LANCZOS)
 
 our_ratio = our.width / our.height
 our_new_w = int(target_h * our_ratio)
@@ -36,8 +41,8 @@ comparison.paste(ref_resized, (x_ref, 10))
 
 # Paste ours at bottom (centered)
 x_our = (total_w - our_new_w) // 2
-comparison.paste(our_resized.convert('RGB'), (x_our, target_h + 30))
+comparison.paste(our_resized, (x_our, target_h + 30))
 
-output_path = "/Users/iheanyi/development/grove/docs/logo/reference-vs-ours.png"
-comparison.save(output_path)
+output_path = os.path.join(LOGO_DIR, "reference-vs-ours.png")
+save_png(comparison, output_path)
 print(f"Saved: {output_path}")
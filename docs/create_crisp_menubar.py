@@ -6,14 +6,13 @@ Create crisp menubar icons using the simple tree design.
 from PIL import Image, ImageDraw
 import os
 
+from logo_utils import MENUBAR_RESOURCES_DIR, colorize, save_all
 
-def create_simple_tree(size, color, padding_ratio=0.12):
+
+def tree_geometry(size, padding_ratio=0.12):
     """
-    Simple tree: trunk + circular crown. Clean at small sizes.
+    Compute the simple tree's trunk (x, bottom, top, width) and crown (x, y, radius).
     """
-    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(img)
-
     padding = int(size * padding_ratio)
     cx = size // 2
     base_y = size - padding
@@ -24,17 +23,49 @@ def create_simple_tree(size, color, padding_ratio=0.12):
     trunk_height = (base_y - top_y) * 0.38
     trunk_top = base_y - trunk_height
 
-    draw.line([(cx, base_y), (cx, trunk_top)], fill=color, width=int(trunk_width))
-
     # Crown - filled circle
     crown_center_y = trunk_top - (base_y - top_y) * 0.28
     crown_radius = (base_y - top_y) * 0.32
 
-    draw.ellipse(
-        [cx - crown_radius, crown_center_y - crown_radius,
-         cx + crown_radius, crown_center_y + crown_radius],
-        fill=color
-    )
+    return {
+        'trunk': (cx, base_y, trunk_top, int(trunk_width)),
+        'crown': (cx, crown_center_y, crown_radius),
+    }
+
+
+# Menubar sizes - create crisp versions
+MENUBAR_SIZES = {
+    "MenuBarIcon": 18,
+    "MenuBarIcon@2x": 36,
+    "MenuBarIcon-22": 22,
+    "MenuBarIcon-22@2x": 44,
+}
+MENUBAR_SUPERSAMPLE = 8
+
+# Targets at or below this size skip the Lanczos kernel in create_supersampled
+SMALL_ICON_MAX = 32
+
+# Geometry for the fixed menubar canvases, computed once at import time
+TREE_PRECOMPUTED = {
+    size * MENUBAR_SUPERSAMPLE: tree_geometry(size * MENUBAR_SUPERSAMPLE)
+    for size in MENUBAR_SIZES.values()
+}
+
+
+def create_simple_tree(size):
+    """
+    Simple tree: trunk + circular crown. Clean at small sizes.
+
+    Drawn as an 'L' coverage mask; colorize() after downsampling.
+    """
+    geometry = TREE_PRECOMPUTED.get(size) or tree_geometry(size)
+    x, base_y, trunk_top, trunk_width = geometry['trunk']
+    cx, cy, radius = geometry['crown']
+
+    img = Image.new('L', (size, size), 0)
+    draw = ImageDraw.Draw(img)
+    draw.line([(x, base_y), (x, trunk_top)], fill=255, width=trunk_width)
+    draw.ellipse([cx - radius, cy - radius, cx + radius, cy + radius], fill=255)
 
     return img
 
@@ -42,35 +73,39 @@ def create_simple_tree(size, color, padding_ratio=0.12):
 def create_supersampled(target_size, color, supersample=4):
     """Create at higher resolution and downsample for anti-aliasing."""
     large_size = target_size * supersample
-    large_img = create_simple_tree(large_size, color)
-    return large_img.resize((target_size, target_size), Image.Resampling.LANCZOS)
+    large_img = create_simple_tree(large_size)
+
+    if target_size <= SMALL_ICON_MAX:
+        # At 8x supersampling the averaging dominates; a box reduce to 2x
+        # and a bilinear finish look the same as Lanczos at these sizes
+        resized = large_img.resize((target_size * 2, target_size * 2), Image.Resampling.BOX)
+        resized = resized.resize((target_size, target_size), Image.Resampling.BILINEAR)
+    else:
+        # Box-reduce to within 3x of the target before the LANCZOS pass
+        resized = large_img.resize((target_size, target_size), Image.Resampling.LANCZOS,
+                                   reducing_gap=3.0)
+    return colorize(resized, color)
 
 
 def main():
-    output_dir = "/Users/iheanyi/development/grove/menubar/GroveMenubar/Sources/GroveMenubar/Resources"
+    output_dir = MENUBAR_RESOURCES_DIR
     os.makedirs(output_dir, exist_ok=True)
 
     black = (0, 0, 0, 255)
 
-    # Menubar sizes - create crisp versions
-    sizes = {
-        "MenuBarIcon": 18,
-        "MenuBarIcon@2x": 36,
-        "MenuBarIcon-22": 22,
-        "MenuBarIcon-22@2x": 44,
-    }
-
     print("Creating crisp menubar icons...")
 
-    for name, size in sizes.items():
-        img = create_supersampled(size, black, supersample=8)
+    tasks = []
+    for name, size in MENUBAR_SIZES.items():
+        img = create_supersampled(size, black, supersample=MENUBAR_SUPERSAMPLE)
         path = os.path.join(output_dir, f"{name}.png")
-        img.save(path)
+        tasks.append((img, path))
         print(f"  {name}: {size}px")
 
     # Preview for verification
     preview = create_supersampled(128, black, supersample=4)
-    preview.save(os.path.join(output_dir, "preview.png"))
+    tasks.append((preview, os.path.join(output_dir, "preview.png")))
+    save_all(tasks)
     print(f"\nPreview saved for verification")
 
     print("Done!")
@@ -6,50 +6,59 @@ Recreates the branching tree with git icon design for macOS dock.
 """
 
 from PIL import Image, ImageDraw
+import collections
 import math
 import os
 
+from logo_utils import (LOGO_DIR, draw_branch_paths, make_master_cache, save_all,
+                        sin_cos_deg)
 
-def draw_branch(draw, start, angle, length, width, depth, max_depth, color):
+
+def branch_segments(start, angle, length, width, max_depth):
     """
-    Recursively draw branches of the tree.
+    Collect the segments of a branch and all of its sub-branches.
+
+    Walks the branching breadth-first with a queue instead of recursion and
+    returns a list of (x0, y0, x1, y1, width, parent) tuples in depth
+    order, where parent is the index the segment grows from (-1 for the root).
     """
-    if depth > max_depth or length < 2:
-        return
+    segments = []
+
+    queue = collections.deque()
+    if length >= 2:
+        queue.append((start, angle, length, width, 0, -1))
+
+    while queue:
+        start, angle, length, width, depth, parent = queue.popleft()
 
-    # Calculate end point
-    end_x = start[0] + length * math.sin(math.radians(angle))
-    end_y = start[1] - length * math.cos(math.radians(angle))
-    end = (end_x, end_y)
+        # Calculate end point
+        sin, cos = sin_cos_deg(angle)
+        end_x = start[0] + length * sin
+        end_y = start[1] - length * cos
+        end = (end_x, end_y)
 
-    # Draw this branch
-    draw.line([start, end], fill=color, width=max(1, int(width)))
+        segments.append((start[0], start[1], end_x, end_y, width, parent))
+        parent = len(segments) - 1
 
-    # Draw rounded cap at branch tip
-    cap_radius = width / 2
-    draw.ellipse(
-        [end_x - cap_radius, end_y - cap_radius,
-         end_x + cap_radius, end_y + cap_radius],
-        fill=color
-    )
+        # Reduce length and width for child branches
+        new_length = length * 0.65
+        new_width = width * 0.7
 
-    # Recursively draw sub-branches
-    # Reduce length and width for child branches
-    new_length = length * 0.65
-    new_width = width * 0.7
+        # Branch angles - spread out from current direction
+        spread = 35 + depth * 5  # Wider spread at higher depths
 
-    # Branch angles - spread out from current direction
-    spread = 35 + depth * 5  # Wider spread at higher depths
+        # Left and right sub-branches, skipping ones too short to draw
+        if depth < max_depth and new_length >= 2:
+            queue.append((end, angle - spread, new_length, new_width, depth + 1, parent))
+            queue.append((end, angle + spread, new_length, new_width, depth + 1, parent))
 
-    # Left branch
-    draw_branch(draw, end, angle - spread, new_length, new_width, depth + 1, max_depth, color)
-    # Right branch
-    draw_branch(draw, end, angle + spread, new_length, new_width, depth + 1, max_depth, color)
+    return segments
 
 
-def draw_git_tag(draw, center_x, center_y, size, color, bg_color=None):
+def draw_git_tag(draw, center_x, center_y, size):
     """
-    Draw the git branch/tag icon (tilted rounded rectangle with branch symbol).
+    Draw the git branch/tag icon (tilted rounded rectangle with branch symbol)
+    into an 'L' mask, with the inner cutout left transparent.
     """
     # The tag is a tilted rounded square
     angle = 45  # degrees
@@ -64,53 +73,51 @@ def draw_git_tag(draw, center_x, center_y, size, color, bg_color=None):
         corners.append((x, y))
 
     # Draw the tag shape
-    draw.polygon(corners, fill=color)
-
-    # Draw the hole/cutout for the git symbol (if bg_color provided)
-    if bg_color:
-        # Inner rounded rectangle (smaller, creates border effect)
-        inner_size = size * 0.7
-        inner_half = inner_size / 2
-        inner_corners = []
-        for i in range(4):
-            corner_angle = math.radians(angle + i * 90)
-            x = center_x + inner_half * math.cos(corner_angle)
-            y = center_y + inner_half * math.sin(corner_angle)
-            inner_corners.append((x, y))
-        draw.polygon(inner_corners, fill=bg_color)
-
-        # Git branch symbol inside
-        # Main line (vertical in the tag's coordinate space, so diagonal in screen space)
-        line_length = inner_size * 0.5
-        line_start = (center_x - line_length * 0.4, center_y + line_length * 0.4)
-        line_end = (center_x + line_length * 0.4, center_y - line_length * 0.4)
-        branch_width = max(2, size * 0.08)
-        draw.line([line_start, line_end], fill=color, width=int(branch_width))
-
-        # Branch coming off
-        branch_start = (center_x, center_y)
-        branch_end = (center_x + line_length * 0.35, center_y + line_length * 0.1)
-        draw.line([branch_start, branch_end], fill=color, width=int(branch_width))
-
-        # Dots at branch points
-        dot_radius = size * 0.06
-        for point in [line_start, line_end, branch_end]:
-            draw.ellipse(
-                [point[0] - dot_radius, point[1] - dot_radius,
-                 point[0] + dot_radius, point[1] + dot_radius],
-                fill=color
-            )
-
-
-def create_grove_dock_icon(size, color, bg_color=None, padding_ratio=0.1):
-    """
-    Create the full grove dock icon with branching tree and git tag.
+    draw.polygon(corners, fill=255)
+
+    # Inner rounded rectangle (smaller, creates border effect)
+    inner_size = size * 0.7
+    inner_half = inner_size / 2
+    inner_corners = []
+    for i in range(4):
+        corner_angle = math.radians(angle + i * 90)
+        x = center_x + inner_half * math.cos(corner_angle)
+        y = center_y + inner_half * math.sin(corner_angle)
+        inner_corners.append((x, y))
+    draw.polygon(inner_corners, fill=0)
+
+    # Git branch symbol inside
+    # Main line (vertical in the tag's coordinate space, so diagonal in screen space)
+    line_length = inner_size * 0.5
+    line_start = (center_x - line_length * 0.4, center_y + line_length * 0.4)
+    line_end = (center_x + line_length * 0.4, center_y - line_length * 0.4)
+    branch_width = max(2, size * 0.08)
+    draw.line([line_start, line_end], fill=255, width=int(branch_width))
+
+    # Branch coming off
+    branch_start = (center_x, center_y)
+    branch_end = (center_x + line_length * 0.35, center_y + line_length * 0.1)
+    draw.line([branch_start, branch_end], fill=255, width=int(branch_width))
+
+    # Dots at branch points
+    dot_radius = size * 0.06
+    for point in [line_start, line_end, branch_end]:
+        draw.ellipse(
+            [point[0] - dot_radius, point[1] - dot_radius,
+             point[0] + dot_radius, point[1] + dot_radius],
+            fill=255
+        )
+
+
+def render_mask(size, padding_ratio=0.1):
     """
-    if bg_color is None:
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    else:
-        img = Image.new('RGBA', (size, size), bg_color)
+    Render the full grove dock icon (branching tree and git tag) as an 'L'
+    coverage mask.
 
+    The icon is a single color on a transparent background, so color is
+    applied only after the mask has been downsampled.
+    """
+    img = Image.new('L', (size, size), 0)
     draw = ImageDraw.Draw(img)
 
     padding = int(size * padding_ratio)
@@ -128,16 +135,16 @@ def create_grove_dock_icon(size, color, bg_color=None, padding_ratio=0.1):
     trunk_top = (cx, tree_bottom - trunk_length)
 
     # Draw main trunk
-    draw.line([trunk_base, trunk_top], fill=color, width=int(trunk_width))
+    draw.line([trunk_base, trunk_top], fill=255, width=int(trunk_width))
 
     # Branch from trunk top
     branch_length = trunk_length * 1.2
     branch_width = trunk_width * 0.85
 
-    # Draw branches recursively from trunk top
     # Two main branches going left and right
-    draw_branch(draw, trunk_top, -25, branch_length, branch_width, 0, 4, color)
-    draw_branch(draw, trunk_top, 25, branch_length, branch_width, 0, 4, color)
+    for angle in (-25, 25):
+        segments = branch_segments(trunk_top, angle, branch_length, branch_width, 4)
+        draw_branch_paths(draw, segments, 255)
 
     # Git tag at the bottom
     tag_size = size * 0.18
@@ -145,21 +152,18 @@ def create_grove_dock_icon(size, color, bg_color=None, padding_ratio=0.1):
     # Offset slightly to the left to match reference
     tag_center_x = cx - size * 0.08
 
-    draw_git_tag(draw, tag_center_x, tag_center_y, tag_size, color, bg_color if bg_color else (0, 0, 0, 0))
+    draw_git_tag(draw, tag_center_x, tag_center_y, tag_size)
 
     # Connection line from trunk to tag
     conn_width = max(2, trunk_width * 0.4)
     draw.line([(cx, tree_bottom), (tag_center_x, tag_center_y - tag_size * 0.5)],
-              fill=color, width=int(conn_width))
+              fill=255, width=int(conn_width))
 
     return img
 
 
-def create_supersampled(target_size, color, bg_color=None, supersample=4):
-    """Create at higher resolution and downsample for anti-aliasing."""
-    large_size = target_size * supersample
-    large_img = create_grove_dock_icon(large_size, color, bg_color)
-    return large_img.resize((target_size, target_size), Image.Resampling.LANCZOS)
+# The icon mask, rendered once on first use and shared by every size and color
+MASTER = make_master_cache(render_mask)
 
 
 def create_macos_iconset(output_dir, color_dark, color_light):
@@ -172,16 +176,20 @@ def create_macos_iconset(output_dir, color_dark, color_light):
 
     # macOS icon sizes
     sizes = [16, 32, 64, 128, 256, 512, 1024]
+    MASTER.resize_all(sizes + [s * 2 for s in sizes if s <= 512])
 
+    tasks = []
     for base_size in sizes:
         # 1x version
-        img = create_supersampled(base_size, color_dark, supersample=4)
-        img.save(os.path.join(iconset_dir, f"icon_{base_size}x{base_size}.png"))
+        img = MASTER.create(base_size, color_dark)
+        tasks.append((img, os.path.join(iconset_dir, f"icon_{base_size}x{base_size}.png")))
 
         # 2x version (for retina)
         if base_size <= 512:
-            img_2x = create_supersampled(base_size * 2, color_dark, supersample=4)
-            img_2x.save(os.path.join(iconset_dir, f"icon_{base_size}x{base_size}@2x.png"))
+            img_2x = MASTER.create(base_size * 2, color_dark)
+            tasks.append((img_2x, os.path.join(iconset_dir, f"icon_{base_size}x{base_size}@2x.png")))
+
+    save_all(tasks)
 
     print(f"Created iconset at: {iconset_dir}")
     print("To create .icns file, run:")
@@ -191,7 +199,7 @@ def create_macos_iconset(output_dir, color_dark, color_light):
 
 
 def main():
-    output_dir = "/Users/iheanyi/development/grove/docs/logo"
+    output_dir = LOGO_DIR
     os.makedirs(output_dir, exist_ok=True)
 
     # Colors
@@ -205,43 +213,48 @@ def main():
 
     # Create preview sizes
     sizes = [64, 128, 256, 512, 1024]
+    preview_size = 300
+    MASTER.resize_all(sizes + [preview_size])
 
+    tasks = []
+    dark_paths = []
     for size in sizes:
         # Dark version (for light backgrounds)
-        img_dark = create_supersampled(size, black, supersample=4)
+        img_dark = MASTER.create(size, black)
         dark_path = os.path.join(output_dir, f"grove-dock-{size}-dark.png")
-        img_dark.save(dark_path)
+        tasks.append((img_dark, dark_path))
+        dark_paths.append(dark_path)
 
         # Light version (for dark backgrounds)
-        img_light = create_supersampled(size, white, supersample=4)
+        img_light = MASTER.create(size, white)
         light_path = os.path.join(output_dir, f"grove-dock-{size}-light.png")
-        img_light.save(light_path)
-
-        print(f"  {size}px: {dark_path}")
+        tasks.append((img_light, light_path))
 
     # Create comparison sheet
     print("\nCreating comparison sheet...")
     sheet_size = 800
     sheet = Image.new('RGBA', (sheet_size, sheet_size), light_bg)
-    draw = ImageDraw.Draw(sheet)
 
     # Dark background for bottom half
-    draw.rectangle([0, sheet_size//2, sheet_size, sheet_size], fill=dark_bg)
+    sheet.paste(dark_bg, (0, sheet_size//2, sheet_size, sheet_size))
 
     # Place logos
-    preview_size = 300
     y_light = (sheet_size // 4) - (preview_size // 2)
     y_dark = (sheet_size * 3 // 4) - (preview_size // 2)
     x = (sheet_size - preview_size) // 2
 
-    img_dark = create_supersampled(preview_size, black, supersample=4)
-    img_light = create_supersampled(preview_size, white, supersample=4)
+    img_dark = MASTER.create(preview_size, black)
+    img_light = MASTER.create(preview_size, white)
 
-    sheet.paste(img_dark, (x, y_light), img_dark)
-    sheet.paste(img_light, (x, y_dark), img_light)
+    sheet.alpha_composite(img_dark, dest=(x, y_light))
+    sheet.alpha_composite(img_light, dest=(x, y_dark))
 
     comparison_path = os.path.join(output_dir, "grove-dock-comparison.png")
-    sheet.save(comparison_path)
+    tasks.append((sheet, comparison_path))
+    save_all(tasks)
+
+    for size, dark_path in zip(sizes, dark_paths):
+        print(f"  {size}px: {dark_path}")
     print(f"Comparison: {comparison_path}")
 
     # Create macOS iconset
@@ -6,51 +6,62 @@ More organic branching pattern matching the reference design.
 """
 
 from PIL import Image, ImageDraw
-import math
+import collections
 import os
 
+from logo_utils import (LOGO_DIR, draw_branch_paths, make_master_cache, save_all,
+                        sin_cos_deg)
 
-def draw_organic_branch(draw, start, angle, length, width, depth, max_depth, color, branch_data):
+
+def organic_branch_segments(start, angle, length, width, max_depth, branch_data):
     """
-    Draw branches with more organic, asymmetric pattern like the reference.
+    Collect branch segments with a more organic, asymmetric pattern like the reference.
+
+    Walks the branching breadth-first with a queue instead of recursion and
+    returns a list of (x0, y0, x1, y1, width, parent) tuples in depth
+    order, where parent is the index the segment grows from (-1 for the root).
     """
-    if depth > max_depth or length < 3 or width < 1:
-        return
+    segments = []
+
+    queue = collections.deque()
+    if length >= 3 and width >= 1:
+        queue.append((start, angle, length, width, 0, -1))
+
+    while queue:
+        start, angle, length, width, depth, parent = queue.popleft()
 
-    # Calculate end point
-    end_x = start[0] + length * math.sin(math.radians(angle))
-    end_y = start[1] - length * math.cos(math.radians(angle))
-    end = (end_x, end_y)
+        # Calculate end point
+        sin, cos = sin_cos_deg(angle)
+        end_x = start[0] + length * sin
+        end_y = start[1] - length * cos
+        end = (end_x, end_y)
 
-    # Draw this branch segment
-    draw.line([start, end], fill=color, width=max(1, int(width)))
+        segments.append((start[0], start[1], end_x, end_y, width, parent))
+        parent = len(segments) - 1
 
-    # Rounded cap at end
-    cap_r = width / 2.2
-    draw.ellipse([end_x - cap_r, end_y - cap_r, end_x + cap_r, end_y + cap_r], fill=color)
+        # Get branching parameters for this depth
+        params = branch_data.get(depth, {'spread': 40, 'length_factor': 0.6, 'width_factor': 0.7})
 
-    # Get branching parameters for this depth
-    params = branch_data.get(depth, {'spread': 40, 'length_factor': 0.6, 'width_factor': 0.7})
+        new_length = length * params['length_factor']
+        new_width = width * params['width_factor']
+        spread = params['spread']
 
-    new_length = length * params['length_factor']
-    new_width = width * params['width_factor']
-    spread = params['spread']
+        # Asymmetric branching - vary the angles slightly
+        left_spread = spread + (depth * 3)
+        right_spread = spread + (depth * 2)
 
-    # Asymmetric branching - vary the angles slightly
-    left_spread = spread + (depth * 3)
-    right_spread = spread + (depth * 2)
+        # Left and right sub-branches, skipping ones too small to draw
+        if depth < max_depth and new_length >= 3 and new_width >= 1:
+            queue.append((end, angle - left_spread, new_length, new_width, depth + 1, parent))
+            queue.append((end, angle + right_spread, new_length, new_width, depth + 1, parent))
 
-    # Left sub-branch
-    draw_organic_branch(draw, end, angle - left_spread, new_length, new_width,
-                       depth + 1, max_depth, color, branch_data)
-    # Right sub-branch
-    draw_organic_branch(draw, end, angle + right_spread, new_length, new_width,
-                       depth + 1, max_depth, color, branch_data)
+    return segments
 
 
-def draw_git_tag_diamond(draw, cx, cy, size, color, inner_color):
+def draw_git_tag_diamond(draw, cx, cy, size):
     """
-    Draw git tag as tilted diamond with git branch symbol inside.
+    Draw git tag as tilted diamond with git branch symbol inside, into an 'L'
+    mask with the inner diamond left transparent.
     """
     # Diamond points (rotated square)
     half = size / 2
@@ -62,7 +73,7 @@ def draw_git_tag_diamond(draw, cx, cy, size, color, inner_color):
     ]
 
     # Draw outer diamond
-    draw.polygon(points, fill=color)
+    draw.polygon(points, fill=255)
 
     # Draw inner diamond (creates border effect)
     inner_half = half * 0.72
@@ -72,7 +83,7 @@ def draw_git_tag_diamond(draw, cx, cy, size, color, inner_color):
         (cx, cy + inner_half),
         (cx - inner_half, cy),
     ]
-    draw.polygon(inner_points, fill=inner_color)
+    draw.polygon(inner_points, fill=0)
 
     # Git branch symbol inside
     # A simple branching line pattern
@@ -83,30 +94,27 @@ def draw_git_tag_diamond(draw, cx, cy, size, color, inner_color):
     main_len = inner_half * 0.6
     p1 = (cx - main_len * 0.5, cy + main_len * 0.5)
     p2 = (cx + main_len * 0.5, cy - main_len * 0.5)
-    draw.line([p1, p2], fill=color, width=int(line_w))
+    draw.line([p1, p2], fill=255, width=int(line_w))
 
     # Branch line
     branch_start = (cx - main_len * 0.1, cy + main_len * 0.1)
     branch_end = (cx + main_len * 0.4, cy + main_len * 0.25)
-    draw.line([branch_start, branch_end], fill=color, width=int(line_w))
+    draw.line([branch_start, branch_end], fill=255, width=int(line_w))
 
     # Dots at endpoints
     for p in [p1, p2, branch_end]:
-        draw.ellipse([p[0]-dot_r, p[1]-dot_r, p[0]+dot_r, p[1]+dot_r], fill=color)
+        draw.ellipse([p[0]-dot_r, p[1]-dot_r, p[0]+dot_r, p[1]+dot_r], fill=255)
 
 
-def create_grove_dock_icon_v2(size, color, bg_color=None, padding_ratio=0.08):
+def render_mask_v2(size, padding_ratio=0.08):
     """
-    Create grove dock icon with organic branching tree and git tag.
-    """
-    transparent = (0, 0, 0, 0)
-    if bg_color is None:
-        img = Image.new('RGBA', (size, size), transparent)
-        inner_color = transparent
-    else:
-        img = Image.new('RGBA', (size, size), bg_color)
-        inner_color = bg_color
+    Render the grove dock icon (organic branching tree and git tag) as an 'L'
+    coverage mask.
 
+    The icon is a single color on a transparent background, so color is
+    applied only after the mask has been downsampled.
+    """
+    img = Image.new('L', (size, size), 0)
     draw = ImageDraw.Draw(img)
 
     padding = int(size * padding_ratio)
@@ -125,7 +133,7 @@ def create_grove_dock_icon_v2(size, color, bg_color=None, padding_ratio=0.08):
     trunk_width = size * 0.055
 
     # Draw trunk
-    draw.line([(cx, trunk_bottom_y), (cx, trunk_top_y)], fill=color, width=int(trunk_width))
+    draw.line([(cx, trunk_bottom_y), (cx, trunk_top_y)], fill=255, width=int(trunk_width))
 
     # The trunk splits into two main curved branches
     # We'll draw them as angled lines that then branch further
@@ -146,35 +154,31 @@ def create_grove_dock_icon_v2(size, color, bg_color=None, padding_ratio=0.08):
     # Two main branches from trunk top
     trunk_top = (cx, trunk_top_y)
 
-    # Left main branch
-    draw_organic_branch(draw, trunk_top, -22, main_branch_length, main_branch_width,
-                       0, 4, color, branch_data)
-    # Right main branch
-    draw_organic_branch(draw, trunk_top, 22, main_branch_length, main_branch_width,
-                       0, 4, color, branch_data)
+    # Left and right main branches
+    for angle in (-22, 22):
+        segments = organic_branch_segments(trunk_top, angle, main_branch_length,
+                                           main_branch_width, 4, branch_data)
+        draw_branch_paths(draw, segments, 255, cap_ratio=1 / 2.2)
 
     # Connection line from trunk to tag (slightly offset to left like reference)
     tag_cx = cx - size * 0.06
     conn_top = (cx, trunk_bottom_y)
     conn_bottom = (tag_cx, tag_center_y - tag_size * 0.5)
     conn_width = max(2, trunk_width * 0.5)
-    draw.line([conn_top, conn_bottom], fill=color, width=int(conn_width))
+    draw.line([conn_top, conn_bottom], fill=255, width=int(conn_width))
 
     # Git tag
-    draw_git_tag_diamond(draw, tag_cx, tag_center_y, tag_size, color, inner_color)
+    draw_git_tag_diamond(draw, tag_cx, tag_center_y, tag_size)
 
     return img
 
 
-def create_supersampled_v2(target_size, color, bg_color=None, supersample=4):
-    """Create at higher resolution and downsample for anti-aliasing."""
-    large_size = target_size * supersample
-    large_img = create_grove_dock_icon_v2(large_size, color, bg_color)
-    return large_img.resize((target_size, target_size), Image.Resampling.LANCZOS)
+# The icon mask, rendered once on first use and shared by every size and color
+MASTER = make_master_cache(render_mask_v2)
 
 
 def main():
-    output_dir = "/Users/iheanyi/development/grove/docs/logo"
+    output_dir = LOGO_DIR
     os.makedirs(output_dir, exist_ok=True)
 
     black = (0, 0, 0, 255)
@@ -187,42 +191,46 @@ def main():
 
     # Create various sizes
     sizes = [64, 128, 256, 512, 1024]
+    preview_size = 350
+    icon_sizes = [16, 32, 64, 128, 256, 512]
+    MASTER.resize_all(sizes + [preview_size] + icon_sizes + [s * 2 for s in icon_sizes])
 
+    tasks = []
     for size in sizes:
-        img_dark = create_supersampled_v2(size, black, supersample=4)
+        img_dark = MASTER.create(size, black)
         dark_path = os.path.join(output_dir, f"grove-dock-v2-{size}-dark.png")
-        img_dark.save(dark_path)
+        tasks.append((img_dark, dark_path))
 
-        img_light = create_supersampled_v2(size, white, supersample=4)
+        img_light = MASTER.create(size, white)
         light_path = os.path.join(output_dir, f"grove-dock-v2-{size}-light.png")
-        img_light.save(light_path)
-
-        print(f"  {size}px created")
+        tasks.append((img_light, light_path))
 
     # Comparison sheet
     print("\nCreating comparison sheet...")
     sheet_w, sheet_h = 900, 500
     sheet = Image.new('RGBA', (sheet_w, sheet_h), light_bg)
-    draw = ImageDraw.Draw(sheet)
 
     # Dark bg on right half
-    draw.rectangle([sheet_w//2, 0, sheet_w, sheet_h], fill=dark_bg)
+    sheet.paste(dark_bg, (sheet_w//2, 0, sheet_w, sheet_h))
 
-    preview_size = 350
     y = (sheet_h - preview_size) // 2
 
     # Dark icon on light bg
-    img_dark = create_supersampled_v2(preview_size, black, supersample=4)
+    img_dark = MASTER.create(preview_size, black)
     x_left = (sheet_w // 4) - (preview_size // 2)
-    sheet.paste(img_dark, (x_left, y), img_dark)
+    sheet.alpha_composite(img_dark, dest=(x_left, y))
 
     # Light icon on dark bg
-    img_light = create_supersampled_v2(preview_size, white, supersample=4)
+    img_light = MASTER.create(preview_size, white)
     x_right = (sheet_w * 3 // 4) - (preview_size // 2)
-    sheet.paste(img_light, (x_right, y), img_light)
+    sheet.alpha_composite(img_light, dest=(x_right, y))
 
     comparison_path = os.path.join(output_dir, "grove-dock-v2-comparison.png")
-    sheet.save(comparison_path)
+    tasks.append((sheet, comparison_path))
+    save_all(tasks)
+
+    for size in sizes:
+        print(f"  {size}px created")
     print(f"Comparison: {comparison_path}")
 
     # Create macOS iconset
@@ -230,13 +238,14 @@ def main():
     iconset_dir = os.path.join(output_dir, "AppIcon.iconset")
     os.makedirs(iconset_dir, exist_ok=True)
 
-    icon_sizes = [16, 32, 64, 128, 256, 512]
+    tasks = []
     for s in icon_sizes:
-        img = create_supersampled_v2(s, black, supersample=4)
-        img.save(os.path.join(iconset_dir, f"icon_{s}x{s}.png"))
+        img = MASTER.create(s, black)
+        tasks.append((img, os.path.join(iconset_dir, f"icon_{s}x{s}.png")))
         if s <= 512:
-            img_2x = create_supersampled_v2(s * 2, black, supersample=4)
-            img_2x.save(os.path.join(iconset_dir, f"icon_{s}x{s}@2x.png"))
+            img_2x = MASTER.create(s * 2, black)
+            tasks.append((img_2x, os.path.join(iconset_dir, f"icon_{s}x{s}@2x.png")))
+    save_all(tasks)
 
     print(f"Iconset: {iconset_dir}")
     print("Run: iconutil -c icns " + iconset_dir)
@@ -7,21 +7,96 @@ Design: Three ascending strokes suggesting tree branches / git worktrees.
 """
 
 from PIL import Image, ImageDraw
+import argparse
 import math
 import os
 
-def create_grove_logo(size, stroke_width, color, bg_color=None, padding_ratio=0.15):
+from logo_utils import LOGO_DIR, colorize, save_all
+
+# Pillow fills polygons including their edge pixels; insetting outlines by
+# half a pixel keeps them the same weight as draw.line / draw.ellipse
+EDGE_INSET = 0.5
+
+
+def _stroke_end(tip, angle, half_width, cap_radius, samples=16):
+    """
+    Outline points around the end of a stroke pointing at angle (radians).
+
+    Runs from the stroke's minus side to its plus side. With a cap_radius the
+    end is the union of the flat stroke and a disk at the tip, as if an
+    ellipse had been drawn over a line end; otherwise it is cut flat.
+    """
+    if cap_radius:
+        cap_radius -= EDGE_INSET
+    dx, dy = math.cos(angle), math.sin(angle)
+    nx, ny = dy, -dx  # normal toward the minus side
+    if not cap_radius:
+        return [(tip[0] + nx * half_width, tip[1] + ny * half_width),
+                (tip[0] - nx * half_width, tip[1] - ny * half_width)]
+
+    # Where the stroke's sides meet the cap circle, measured back from the tip
+    back = math.sqrt(max(cap_radius ** 2 - half_width ** 2, 0))
+    sweep = math.pi / 2 + math.atan2(back, half_width)
+    bx, by = tip[0] - dx * back, tip[1] - dy * back
+
+    points = [(bx + nx * half_width, by + ny * half_width)]
+    for i in range(samples + 1):
+        a = angle - sweep + 2 * sweep * i / samples
+        points.append((tip[0] + cap_radius * math.cos(a), tip[1] + cap_radius * math.sin(a)))
+    points.append((bx - nx * half_width, by - ny * half_width))
+    return points
+
+
+def stroke_outline(start, end, stroke_width, cap_radius=None):
+    """
+    Outline a straight stroke with a flat start and an optionally round end.
+    """
+    angle = math.atan2(end[1] - start[1], end[0] - start[0])
+    half_width = stroke_width / 2 - EDGE_INSET
+    return _stroke_end(start, angle + math.pi, half_width, None) + \
+        _stroke_end(end, angle, half_width, cap_radius)
+
+
+def star_outline(center, arms, stroke_width):
+    """
+    Outline strokes radiating from one center point as a single polygon.
+
+    arms is a list of (tip, cap_radius) pairs, with cap_radius None for a
+    flat end. Neighbouring arms are joined at the inner corner where their
+    sides cross, so the gap between any two neighbours must be under 180
+    degrees.
+    """
+    half_width = stroke_width / 2 - EDGE_INSET
+    arms = sorted(
+        (math.atan2(tip[1] - center[1], tip[0] - center[0]), tip, cap_radius)
+        for tip, cap_radius in arms
+    )
+
+    points = []
+    for i, (angle, tip, cap_radius) in enumerate(arms):
+        points += _stroke_end(tip, angle, half_width, cap_radius)
+
+        # Inner corner between this arm's plus side and the next arm's minus side
+        next_angle = arms[(i + 1) % len(arms)][0] + (2 * math.pi if i == len(arms) - 1 else 0)
+        gap = next_angle - angle
+        reach = half_width / math.sin(gap / 2)
+        mid = angle + gap / 2
+        points.append((center[0] + reach * math.cos(mid), center[1] + reach * math.sin(mid)))
+
+    return points
+
+
+def create_grove_logo(size, stroke_width, padding_ratio=0.15):
     """
     Create a grove logo at the specified size.
 
     The design: Three stylized tree/branch forms rising from a common base,
     representing a grove of trees and the branching nature of git worktrees.
+
+    Like the other designs, this draws an 'L' coverage mask that is colorized
+    after downsampling.
     """
-    # Create image with transparency if no bg_color
-    if bg_color is None:
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    else:
-        img = Image.new('RGBA', (size, size), bg_color)
+    img = Image.new('L', (size, size), 0)
 
     draw = ImageDraw.Draw(img)
 
@@ -64,42 +139,23 @@ def create_grove_logo(size, stroke_width, color, bg_color=None, padding_ratio=0.
     branch_y = trunk_top_y + inner_size * 0.05
     branch_point = (cx, branch_y)
 
-    # Draw trunk
-    draw.line([trunk_bottom, branch_point], fill=color, width=stroke_width)
-
-    # Draw three branches with slight curves implied by the angles
-    # Left branch
-    draw.line([branch_point, left_top], fill=color, width=stroke_width)
-
-    # Center branch (continues straight up)
-    draw.line([branch_point, center_top], fill=color, width=stroke_width)
-
-    # Right branch
-    draw.line([branch_point, right_top], fill=color, width=stroke_width)
-
-    # Add small circular terminals at branch tips for polish
+    # Trunk and three branches as one outline; the branch tips get small
+    # circular terminals for polish, the trunk base stays flat
     terminal_radius = max(1, stroke_width // 2)
-
-    for point in [left_top, center_top, right_top]:
-        x, y = point
-        draw.ellipse(
-            [x - terminal_radius, y - terminal_radius,
-             x + terminal_radius, y + terminal_radius],
-            fill=color
-        )
+    arms = [(trunk_bottom, None)] + [
+        (tip, terminal_radius) for tip in (left_top, center_top, right_top)
+    ]
+    draw.polygon(star_outline(branch_point, arms, stroke_width), fill=255)
 
     return img
 
 
-def create_grove_logo_v2(size, stroke_width, color, bg_color=None, padding_ratio=0.12):
+def create_grove_logo_v2(size, stroke_width, padding_ratio=0.12):
     """
     Alternative design: Abstract tree silhouette - single trunk with crown.
     More organic, suggests a tree canopy.
     """
-    if bg_color is None:
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    else:
-        img = Image.new('RGBA', (size, size), bg_color)
+    img = Image.new('L', (size, size), 0)
 
     draw = ImageDraw.Draw(img)
 
@@ -114,7 +170,7 @@ def create_grove_logo_v2(size, stroke_width, color, bg_color=None, padding_ratio
     trunk_height = (base_y - top_y) * 0.4
     trunk_top = base_y - trunk_height
 
-    draw.line([(cx, base_y), (cx, trunk_top)], fill=color, width=trunk_width)
+    draw.line([(cx, base_y), (cx, trunk_top)], fill=255, width=trunk_width)
 
     # Crown - three overlapping circles suggesting foliage
     crown_center_y = trunk_top - (base_y - top_y) * 0.25
@@ -124,21 +180,18 @@ def create_grove_logo_v2(size, stroke_width, color, bg_color=None, padding_ratio
     draw.ellipse(
         [cx - crown_radius, crown_center_y - crown_radius,
          cx + crown_radius, crown_center_y + crown_radius],
-        fill=color
+        fill=255
     )
 
     return img
 
 
-def create_grove_logo_v3(size, stroke_width, color, bg_color=None, padding_ratio=0.1):
+def create_grove_logo_v3(size, stroke_width, padding_ratio=0.1):
     """
     Design v3: Three parallel ascending lines with slight convergence at bottom.
     Minimal, geometric, suggests multiple trees in a grove.
     """
-    if bg_color is None:
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    else:
-        img = Image.new('RGBA', (size, size), bg_color)
+    img = Image.new('L', (size, size), 0)
 
     draw = ImageDraw.Draw(img)
 
@@ -170,34 +223,22 @@ def create_grove_logo_v3(size, stroke_width, color, bg_color=None, padding_ratio
     right_bottom = (cx + bottom_spread, base_y)
     right_top = (cx + top_spread, base_y - side_height)
 
-    # Draw lines
-    draw.line([left_bottom, left_top], fill=color, width=stroke_width)
-    draw.line([center_bottom, center_top], fill=color, width=stroke_width)
-    draw.line([right_bottom, right_top], fill=color, width=stroke_width)
-
-    # Rounded terminals
+    # Each line and its rounded terminal as one outline
     terminal_radius = max(1, stroke_width * 0.6)
 
-    for point in [left_top, center_top, right_top]:
-        x, y = point
-        draw.ellipse(
-            [x - terminal_radius, y - terminal_radius,
-             x + terminal_radius, y + terminal_radius],
-            fill=color
-        )
+    for bottom, top in [(left_bottom, left_top), (center_bottom, center_top),
+                        (right_bottom, right_top)]:
+        draw.polygon(stroke_outline(bottom, top, stroke_width, terminal_radius), fill=255)
 
     return img
 
 
-def create_grove_logo_v4(size, stroke_width, color, bg_color=None, padding_ratio=0.12):
+def create_grove_logo_v4(size, stroke_width, padding_ratio=0.12):
     """
     Design v4: Stylized 'G' that incorporates a tree branch.
     Letter-based but organic.
     """
-    if bg_color is None:
-        img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
-    else:
-        img = Image.new('RGBA', (size, size), bg_color)
+    img = Image.new('L', (size, size), 0)
 
     draw = ImageDraw.Draw(img)
 
@@ -213,38 +254,48 @@ def create_grove_logo_v4(size, stroke_width, color, bg_color=None, padding_ratio
 
     # Draw arc (open circle) - from about 45 degrees to 315 degrees
     # PIL angles: 0 is 3 o'clock, goes counter-clockwise
-    draw.arc(bbox, start=45, end=315, fill=color, width=stroke_width)
+    draw.arc(bbox, start=45, end=315, fill=255, width=stroke_width)
 
     # Horizontal bar of G
     bar_y = cy
     bar_left = cx
     bar_right = cx + radius * 0.5
-    draw.line([(bar_left, bar_y), (bar_right, bar_y)], fill=color, width=stroke_width)
+    draw.line([(bar_left, bar_y), (bar_right, bar_y)], fill=255, width=stroke_width)
 
     # Small branch/leaf accent on top right
     branch_start = (cx + radius * 0.5, padding + stroke_width)
     branch_end = (cx + radius * 0.8, padding - stroke_width * 2)
-    draw.line([branch_start, branch_end], fill=color, width=max(1, stroke_width // 2))
+    draw.line([branch_start, branch_end], fill=255, width=max(1, stroke_width // 2))
 
     return img
 
 
-def create_supersampled(create_func, target_size, supersample=4, **kwargs):
-    """Create logo at higher resolution and downsample for anti-aliasing."""
+def create_supersampled_mask(create_func, target_size, supersample=4, **kwargs):
+    """
+    Create a logo mask at higher resolution and downsample for anti-aliasing.
+
+    Returns the 'L' mask so callers can colorize one render in several colors.
+    """
     large_size = target_size * supersample
     large_stroke = kwargs.get('stroke_width', 2) * supersample
 
-    # Create at large size
+    # Create the mask at large size
     large_kwargs = kwargs.copy()
     large_kwargs['stroke_width'] = large_stroke
     large_img = create_func(large_size, **large_kwargs)
 
-    # Downsample with high-quality resampling
-    return large_img.resize((target_size, target_size), Image.Resampling.LANCZOS)
+    # Box-average each supersample x supersample block.
+    # The designs are flat line art, so this matches LANCZOS at a fraction of the cost.
+    return large_img.reduce(supersample)
 
 
 def main():
-    output_dir = "/Users/iheanyi/development/grove/docs/logo"
+    parser = argparse.ArgumentParser(description="Generate the Grove logo variants.")
+    parser.add_argument("--comparison", action="store_true",
+                        help="also render the side-by-side comparison sheet")
+    args = parser.parse_args()
+
+    output_dir = LOGO_DIR
     os.makedirs(output_dir, exist_ok=True)
 
     # Colors
@@ -271,8 +322,12 @@ def main():
     print("Generating Grove logo variants...")
     print("=" * 50)
 
+    # Reported once everything is saved, so a failed save is not preceded
+    # by lines claiming its file was created
+    tasks = []
+    report = []
     for design_name, design_func in designs.items():
-        print(f"\nDesign: {design_name}")
+        report.append(f"\nDesign: {design_name}")
 
         for size_name, size in sizes.items():
             # Calculate appropriate stroke width for size
@@ -289,73 +344,71 @@ def main():
             else:
                 stroke = 16
 
-            # Create dark version (for light backgrounds)
-            img_dark = create_supersampled(
+            # Strokes are tuned per size, so each size gets its own render;
+            # both colors share it
+            mask = create_supersampled_mask(
                 design_func, size,
                 supersample=4,
-                stroke_width=stroke,
-                color=black
+                stroke_width=stroke
             )
 
-            # Create light version (for dark backgrounds)
-            img_light = create_supersampled(
-                design_func, size,
-                supersample=4,
-                stroke_width=stroke,
-                color=white
-            )
+            # Dark version (for light backgrounds)
+            img_dark = colorize(mask, black)
+
+            # Light version (for dark backgrounds)
+            img_light = colorize(mask, white)
 
             # Save
             dark_path = os.path.join(output_dir, f"grove-{design_name}-{size_name}-dark.png")
             light_path = os.path.join(output_dir, f"grove-{design_name}-{size_name}-light.png")
 
-            img_dark.save(dark_path)
-            img_light.save(light_path)
-
-            print(f"  {size_name} ({size}px): {dark_path}")
-
-    # Create a comparison sheet
-    print("\nCreating comparison sheet...")
-
-    sheet_size = 800
-    sheet = Image.new('RGBA', (sheet_size, sheet_size), (240, 240, 240, 255))
-    draw = ImageDraw.Draw(sheet)
-
-    # Draw dark background for bottom half
-    draw.rectangle([0, sheet_size//2, sheet_size, sheet_size], fill=(30, 30, 30, 255))
-
-    # Place logos
-    preview_size = 128
-    y_light = 100
-    y_dark = sheet_size // 2 + 100
-
-    for i, (design_name, design_func) in enumerate(designs.items()):
-        x = 100 + i * 220
-
-        # Create preview versions
-        img_dark = create_supersampled(
-            design_func, preview_size,
-            supersample=4,
-            stroke_width=8,
-            color=black
-        )
-        img_light = create_supersampled(
-            design_func, preview_size,
-            supersample=4,
-            stroke_width=8,
-            color=white
-        )
-
-        # Paste on light background
-        sheet.paste(img_dark, (x, y_light), img_dark)
-
-        # Paste on dark background
-        sheet.paste(img_light, (x, y_dark), img_light)
-
-    # Add labels (simple text positioning)
-    comparison_path = os.path.join(output_dir, "grove-logo-comparison.png")
-    sheet.save(comparison_path)
-    print(f"Comparison sheet: {comparison_path}")
+            tasks.append((img_dark, dark_path))
+            tasks.append((img_light, light_path))
+
+            report.append(f"  {size_name} ({size}px): {dark_path}")
+
+    if args.comparison:
+        # Create a comparison sheet
+        print("\nCreating comparison sheet...")
+
+        sheet_size = 800
+        sheet = Image.new('RGBA', (sheet_size, sheet_size), (240, 240, 240, 255))
+
+        # Dark background for bottom half
+        sheet.paste((30, 30, 30, 255), (0, sheet_size//2, sheet_size, sheet_size))
+
+        # Place logos
+        preview_size = 128
+        y_light = 100
+        y_dark = sheet_size // 2 + 100
+
+        for i, (design_name, design_func) in enumerate(designs.items()):
+            x = 100 + i * 220
+
+            # Create preview versions
+            mask = create_supersampled_mask(
+                design_func, preview_size,
+                supersample=4,
+                stroke_width=8
+            )
+            img_dark = colorize(mask, black)
+            img_light = colorize(mask, white)
+
+            # Paste on light background
+            sheet.alpha_composite(img_dark, dest=(x, y_light))
+
+            # Paste on dark background
+            sheet.alpha_composite(img_light, dest=(x, y_dark))
+
+        # Add labels (simple text positioning)
+        comparison_path = os.path.join(output_dir, "grove-logo-comparison.png")
+        tasks.append((sheet, comparison_path))
+        report.append(f"Comparison sheet: {comparison_path}")
+
+    save_all(tasks)
+
+    for line in report:
+        print(line)
 
     print("\n" + "=" * 50)
     print("Logo generation complete!")
@@ -11,11 +11,13 @@ macOS menubar icons should be:
 from PIL import Image
 import os
 
+from logo_utils import LOGO_DIR, MENUBAR_RESOURCES_DIR, save_png
+
 def create_menubar_icons():
     # Load the high-res traced logo
-    source = Image.open("/Users/iheanyi/development/grove/docs/logo/grove-traced-512-dark.png")
+    source = Image.open(os.path.join(LOGO_DIR, "grove-traced-512-dark.png"))
 
-    output_dir = "/Users/iheanyi/development/grove/menubar/GroveMenubar/Sources/GroveMenubar/Resources"
+    output_dir = MENUBAR_RESOURCES_DIR
     os.makedirs(output_dir, exist_ok=True)
 
     # Menubar icon sizes
@@ -26,20 +28,32 @@ def create_menubar_icons():
         "MenuBarIcon-22@2x": 44,
     }
 
+    # Halve the source down to 64px so each icon is resampled from the
+    # smallest level that is still at least its size (or from the source
+    # itself when the icon is larger)
+    levels = [source]
+    while levels[-1].width > 64:
+        levels.append(levels[-1].reduce(2))
+
     for name, size in sizes.items():
         # Resize with high quality
-        resized = source.resize((size, size), Image.Resampling.LANCZOS)
+        candidates = [level for level in levels if level.width >= size]
+        level = candidates[-1] if candidates else levels[0]
+        resized = level.resize((size, size), Image.Resampling.LANCZOS)
 
         # Save
         path = os.path.join(output_dir, f"{name}.png")
-        resized.save(path)
+        save_png(resized, path)
         print(f"Created: {path}")
 
-    # Also copy the dock icon (AppIcon.icns)
+    # Also copy the dock icon (AppIcon.icns). Copy to a temporary name first,
+    # so the existing icon is only replaced once the new one is in place
     import shutil
-    icns_src = "/Users/iheanyi/development/grove/docs/logo/AppIcon.icns"
+    icns_src = os.path.join(LOGO_DIR, "AppIcon.icns")
     icns_dst = os.path.join(output_dir, "AppIcon.icns")
-    shutil.copy(icns_src, icns_dst)
+    icns_tmp = icns_dst + ".tmp"
+    shutil.copyfile(icns_src, icns_tmp)
+    os.replace(icns_tmp, icns_dst)
     print(f"Copied: {icns_dst}")
 
     print("\nDone!")
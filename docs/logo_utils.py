@@ -0,0 +1,178 @@
+"""
+Shared helpers for the Grove logo generator scripts.
+
+The scripts only need Pillow and NumPy. On x86_64, Pillow-SIMD can be
+installed in place of Pillow (pip uninstall pillow && CC="cc -mavx2"
+pip install pillow-simd) to speed up the resizes without code changes;
+it has no effect on Apple Silicon.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+import functools
+import math
+import os
+import types
+
+
+# Paths are derived from this file's location in the repo, so the scripts
+# work from any checkout and any working directory
+DOCS_DIR = os.path.dirname(os.path.abspath(__file__))
+LOGO_DIR = os.path.join(DOCS_DIR, "logo")
+MENUBAR_RESOURCES_DIR = os.path.join(os.path.dirname(DOCS_DIR), "menubar", "GroveMenubar",
+                                     "Sources", "GroveMenubar", "Resources")
+
+# The reference artwork is not checked in; override with GROVE_LOGO_REFERENCE
+REFERENCE_PATH = os.environ.get("GROVE_LOGO_REFERENCE",
+                                os.path.expanduser("~/Downloads/grove.jpg"))
+
+
+# sin/cos of every whole degree. Branch angles are a root angle plus
+# integer spreads, so the walkers look these up instead of calling into
+# math per segment.
+SIN_DEG = [math.sin(math.radians(angle)) for angle in range(360)]
+COS_DEG = [math.cos(math.radians(angle)) for angle in range(360)]
+
+
+def sin_cos_deg(angle):
+    """
+    Return (sin, cos) of an angle in degrees.
+
+    Whole-degree angles come from SIN_DEG/COS_DEG; any other angle falls
+    back to math.
+    """
+    if angle % 1 == 0:
+        index = int(angle) % 360
+        return SIN_DEG[index], COS_DEG[index]
+    radians = math.radians(angle)
+    return math.sin(radians), math.cos(radians)
+
+
+def _strip_outline(path):
+    """
+    Outline a root-to-leaf list of segments as one tapered strip.
+
+    Interior joints are mitered along the bisector of the two segment
+    normals, and the strip's half-width there is the average of the two
+    segments' half-widths.
+    """
+    normals = []
+    for x0, y0, x1, y1, *_ in path:
+        length = math.hypot(x1 - x0, y1 - y0)
+        normals.append((-(y1 - y0) / length, (x1 - x0) / length))
+
+    # (x, y, half_width, offset direction) at the root, each joint and the tip
+    joints = [(path[0][0], path[0][1], path[0][4] / 2, normals[0])]
+    for i in range(1, len(path)):
+        (nx0, ny0), (nx1, ny1) = normals[i - 1], normals[i]
+        scale = 1 + nx0 * nx1 + ny0 * ny1
+        half_width = (path[i - 1][4] + path[i][4]) / 4
+        joints.append((path[i][0], path[i][1], half_width,
+                       ((nx0 + nx1) / scale, (ny0 + ny1) / scale)))
+    joints.append((path[-1][2], path[-1][3], path[-1][4] / 2, normals[-1]))
+
+    left = [(x + nx * h, y + ny * h) for x, y, h, (nx, ny) in joints]
+    right = [(x - nx * h, y - ny * h) for x, y, h, (nx, ny) in reversed(joints)]
+    return left + right
+
+
+def draw_branch_paths(draw, segments, color, cap_ratio=0.5):
+    """
+    Draw a branching tree as one tapered polygon per root-to-leaf path.
+
+    Each segment is (x0, y0, x1, y1, width, parent), where parent is
+    the index of the segment it grows from (-1 for the root). Joints are
+    mitered, so only the leaf tips get a round cap, of radius
+    width * cap_ratio.
+    """
+    parents = {segment[5] for segment in segments}
+
+    for index, (_, _, x1, y1, width, _) in enumerate(segments):
+        if index in parents:
+            continue
+
+        path = []
+        while index >= 0:
+            path.append(segments[index])
+            index = segments[index][5]
+        path.reverse()
+
+        draw.polygon(_strip_outline(path), fill=color)
+
+        # Round cap at the leaf tip
+        cap_radius = width * cap_ratio
+        draw.ellipse(
+            [x1 - cap_radius, y1 - cap_radius,
+             x1 + cap_radius, y1 + cap_radius],
+            fill=color
+        )
+
+
+def colorize(mask, color):
+    """
+    Turn an 'L' coverage mask into an RGBA image of a single color.
+    """
+    channels = [Image.new('L', mask.size, value) for value in color[:3]]
+    alpha = mask if color[3] == 255 else mask.point(lambda a: a * color[3] // 255)
+    return Image.merge('RGBA', channels + [alpha])
+
+
+def map_concurrently(func, items):
+    """
+    Return [func(item) for item in items], run on a thread pool.
+
+    Pillow releases the GIL inside resize and encode, so threads overlap
+    that work without the per-process cost of re-rendering a master.
+    """
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        return list(executor.map(func, items))
+
+
+# The largest dock output is 1024px; masters are rendered at 4x that for anti-aliasing
+MASTER_SIZE = 1024 * 4
+
+
+def make_master_cache(render_mask, master_size=MASTER_SIZE):
+    """
+    Share one render_mask(master_size) 'L' mask across every output size and color.
+
+    Returns a namespace of:
+    - resize(size): the master downsampled to size, cached per size
+    - resize_all(sizes): warm resize for all sizes concurrently
+    - create(size, color): the icon in color on a transparent background
+    """
+    @functools.cache
+    def master():
+        return render_mask(master_size)
+
+    @functools.lru_cache(maxsize=None)
+    def resize(target_size):
+        # Box-reduce to within 3x of the target before the LANCZOS pass
+        return master().resize((target_size, target_size), Image.Resampling.LANCZOS,
+                               reducing_gap=3.0)
+
+    def resize_all(sizes):
+        # Render the master before fanning out so the threads share one render
+        master()
+        map_concurrently(resize, sorted(set(sizes)))
+
+    def create(target_size, color):
+        return colorize(resize(target_size), color)
+
+    return types.SimpleNamespace(resize=resize, resize_all=resize_all, create=create)
+
+
+def save_png(img, path):
+    """
+    Save img as a PNG at path.
+
+    These are build-time assets, so favor encode speed over file size.
+    """
+    img.save(path, format='PNG', compress_level=1)
+
+
+def save_all(tasks):
+    """
+    Save (img, path) pairs as PNGs concurrently.
+    """
+    map_concurrently(lambda task: save_png(*task), tasks)
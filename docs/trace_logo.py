@@ -3,92 +3,119 @@
 Trace the Grove logo from the reference image.
 """
 
-from PIL import Image, ImageDraw, ImageFilter
+from PIL import Image
+import argparse
+import numpy as np
 import os
 
+from logo_utils import LOGO_DIR, REFERENCE_PATH, colorize, save_all
+
 def trace_reference():
     """
     Trace the reference logo by extracting the shape directly.
     """
-    ref_path = "/System/Volumes/Data/Users/iheanyi/Downloads/grove.jpg"
-    ref = Image.open(ref_path).convert('RGBA')
+    ref = Image.open(REFERENCE_PATH)
+
+    # Only luminance is needed for thresholding, so let the JPEG decoder
+    # produce grayscale directly at full resolution
+    ref.draft('L', ref.size)
+    ref = ref.convert('L')
 
     # The reference has two versions side by side
     # Left half is dark on light, right half is light on dark
     # Let's extract the left half (dark logo on light background)
 
     width, height = ref.size
-    left_half = ref.crop((0, 0, width // 2, height))
-
-    # Convert to grayscale for thresholding
-    gray = left_half.convert('L')
+    gray = ref.crop((0, 0, width // 2, height))
 
     # Threshold to get just the logo (dark pixels)
     threshold = 128
-    binary = gray.point(lambda p: 255 if p < threshold else 0)
+    logo = np.asarray(gray) < threshold
+    binary = Image.fromarray(logo.view(np.uint8) * np.uint8(255))
 
     # Convert back to RGBA with transparency
     # Black pixels become the logo, white becomes transparent
-    result = Image.new('RGBA', binary.size, (0, 0, 0, 0))
-    pixels = binary.load()
-    result_pixels = result.load()
-
-    for y in range(binary.height):
-        for x in range(binary.width):
-            if pixels[x, y] == 255:  # Logo pixel (was dark in original)
-                result_pixels[x, y] = (0, 0, 0, 255)
+    result = colorize(binary, (0, 0, 0, 255))
 
     return result, binary
 
 
-def clean_and_resize(img, target_size, padding=0.1):
+def prepare_canvas(img, padding=0.1):
     """
-    Clean up the traced image and resize to target.
+    Find the square, padded region around the traced logo.
+
+    Returns (source, box) for resize_to. When the padded square fits inside
+    the traced image, the source is the image itself and box selects the
+    region, so resize crops and pads for free. Otherwise the logo is centered
+    on a new padded canvas and box is None.
     """
     # Find bounding box of non-transparent pixels
     bbox = img.getbbox()
-    if bbox:
-        # Crop to content
-        cropped = img.crop(bbox)
+    if not bbox:
+        return img, None
 
-        # Calculate size with padding
-        cw, ch = cropped.size
-        max_dim = max(cw, ch)
+    # Calculate size with padding
+    cw, ch = bbox[2] - bbox[0], bbox[3] - bbox[1]
+    max_dim = max(cw, ch)
+    padded_size = int(max_dim / (1 - 2 * padding))
 
-        # Create square canvas with padding
-        padded_size = int(max_dim / (1 - 2 * padding))
-        canvas = Image.new('RGBA', (padded_size, padded_size), (0, 0, 0, 0))
+    # Center the logo
+    x = (padded_size - cw) // 2
+    y = (padded_size - ch) // 2
+    left, top = bbox[0] - x, bbox[1] - y
+    box = (left, top, left + padded_size, top + padded_size)
+    if left >= 0 and top >= 0 and box[2] <= img.width and box[3] <= img.height:
+        return img, box
 
-        # Center the logo
-        x = (padded_size - cw) // 2
-        y = (padded_size - ch) // 2
-        canvas.paste(cropped, (x, y), cropped)
+    # Create square canvas with padding; it is empty, so a plain paste needs no mask
+    canvas = Image.new('RGBA', (padded_size, padded_size), (0, 0, 0, 0))
+    canvas.paste(img.crop(bbox), (x, y))
 
-        # Resize to target
-        return canvas.resize((target_size, target_size), Image.Resampling.LANCZOS)
+    return canvas, None
 
-    return img.resize((target_size, target_size), Image.Resampling.LANCZOS)
 
+def resize_to(source, target_size, box=None):
+    """
+    Resize the box region of a prepared source to target_size.
+    """
+    return source.resize((target_size, target_size), Image.Resampling.LANCZOS, box=box)
 
-def create_light_version(dark_img):
+
+def resize_descending(source, sizes, box=None, min_input=128):
     """
-    Create light (white) version from dark (black) version.
+    Resize a prepared source to every size, largest first.
+
+    Each size at or below the source resolution, down to min_input, becomes
+    the input for the next smaller one, so every LANCZOS pass reads an image
+    at most a few times its output. Sizes below min_input all come from the
+    min_input level rather than chaining further, which would compound the
+    blur on the smallest icons. Sizes above the source resolution are
+    upscales and are always taken from the source itself.
     """
-    result = Image.new('RGBA', dark_img.size, (0, 0, 0, 0))
-    pixels = dark_img.load()
-    result_pixels = result.load()
+    source_size = box[2] - box[0] if box else source.width
+    resized = {}
+    current, current_box = source, box
+    for size in sorted(set(sizes), reverse=True):
+        resized[size] = resize_to(current, size, current_box)
+        if min_input <= size <= source_size:
+            current, current_box = resized[size], None
+    return resized
 
-    for y in range(dark_img.height):
-        for x in range(dark_img.width):
-            r, g, b, a = pixels[x, y]
-            if a > 0:  # Has content
-                result_pixels[x, y] = (255, 255, 255, a)
 
-    return result
+def create_light_version(dark_img):
+    """
+    Create light (white) version from dark (black) version.
+    """
+    return colorize(dark_img.getchannel('A'), (255, 255, 255, 255))
 
 
 def main():
-    output_dir = "/Users/iheanyi/development/grove/docs/logo"
+    parser = argparse.ArgumentParser(description="Trace the Grove logo from the reference image.")
+    parser.add_argument("--comparison", action="store_true",
+                        help="also render the light/dark comparison sheet")
+    args = parser.parse_args()
+
+    output_dir = LOGO_DIR
     os.makedirs(output_dir, exist_ok=True)
 
     print("Tracing reference logo...")
@@ -97,67 +124,76 @@ def main():
     traced, binary = trace_reference()
 
     # Save raw trace for inspection
-    traced.save(os.path.join(output_dir, "traced-raw.png"))
-    print("  Saved raw trace")
+    tasks = [(traced, os.path.join(output_dir, "traced-raw.png"))]
+
+    # Crop and pad once (a single getbbox scan); every size below is resized
+    # from this region
+    source, box = prepare_canvas(traced, padding=0.08)
 
-    # Clean and create different sizes
     sizes = [64, 128, 256, 512, 1024]
+    icon_sizes = [16, 32, 64, 128, 256, 512]
+
+    resized = resize_descending(source, sizes + icon_sizes + [s * 2 for s in icon_sizes], box)
 
+    # Clean and create different sizes
     for size in sizes:
         # Dark version
-        dark = clean_and_resize(traced, size, padding=0.08)
+        dark = resized[size]
         dark_path = os.path.join(output_dir, f"grove-traced-{size}-dark.png")
-        dark.save(dark_path)
+        tasks.append((dark, dark_path))
 
         # Light version
         light = create_light_version(dark)
         light_path = os.path.join(output_dir, f"grove-traced-{size}-light.png")
-        light.save(light_path)
+        tasks.append((light, light_path))
 
-        print(f"  {size}px created")
-
-    # Create comparison sheet
-    print("\nCreating comparison...")
+    if args.comparison:
+        # Create comparison sheet
+        print("\nCreating comparison...")
 
-    light_bg = (245, 245, 245, 255)
-    dark_bg = (40, 40, 40, 255)
+        light_bg = (245, 245, 245, 255)
+        dark_bg = (40, 40, 40, 255)
 
-    sheet_w, sheet_h = 800, 450
-    sheet = Image.new('RGBA', (sheet_w, sheet_h), light_bg)
-    draw = ImageDraw.Draw(sheet)
+        sheet_w, sheet_h = 800, 450
+        sheet = Image.new('RGBA', (sheet_w, sheet_h), light_bg)
+        preview_size = 350
 
-    # Dark bg on right
-    draw.rectangle([sheet_w//2, 0, sheet_w, sheet_h], fill=dark_bg)
+        # Dark bg on right
+        sheet.paste(dark_bg, (sheet_w//2, 0, sheet_w, sheet_h))
 
-    preview_size = 350
-    y = (sheet_h - preview_size) // 2
+        y = (sheet_h - preview_size) // 2
 
-    dark_preview = clean_and_resize(traced, preview_size, padding=0.08)
-    light_preview = create_light_version(dark_preview)
+        dark_preview = resize_to(source, preview_size, box)
+        light_preview = create_light_version(dark_preview)
 
-    x_left = (sheet_w // 4) - (preview_size // 2)
-    x_right = (sheet_w * 3 // 4) - (preview_size // 2)
+        x_left = (sheet_w // 4) - (preview_size // 2)
+        x_right = (sheet_w * 3 // 4) - (preview_size // 2)
 
-    sheet.paste(dark_preview, (x_left, y), dark_preview)
-    sheet.paste(light_preview, (x_right, y), light_preview)
+        sheet.alpha_composite(dark_preview, dest=(x_left, y))
+        sheet.alpha_composite(light_preview, dest=(x_right, y))
 
-    comparison_path = os.path.join(output_dir, "grove-traced-comparison.png")
-    sheet.save(comparison_path)
-    print(f"Comparison: {comparison_path}")
+        comparison_path = os.path.join(output_dir, "grove-traced-comparison.png")
+        tasks.append((sheet, comparison_path))
 
     # Create macOS iconset
     print("\nCreating macOS iconset...")
     iconset_dir = os.path.join(output_dir, "AppIcon.iconset")
     os.makedirs(iconset_dir, exist_ok=True)
 
-    icon_sizes = [16, 32, 64, 128, 256, 512]
+    # Sizes are shared with the outputs above, and saving mutates the image,
+    # so every iconset entry saves its own copy
     for s in icon_sizes:
-        dark = clean_and_resize(traced, s, padding=0.08)
-        dark.save(os.path.join(iconset_dir, f"icon_{s}x{s}.png"))
+        tasks.append((resized[s].copy(), os.path.join(iconset_dir, f"icon_{s}x{s}.png")))
         if s <= 512:
-            dark_2x = clean_and_resize(traced, s * 2, padding=0.08)
-            dark_2x.save(os.path.join(iconset_dir, f"icon_{s}x{s}@2x.png"))
+            tasks.append((resized[s * 2].copy(), os.path.join(iconset_dir, f"icon_{s}x{s}@2x.png")))
 
+    save_all(tasks)
+
+    print("\n  Saved raw trace")
+    for size in sizes:
+        print(f"  {size}px created")
+    if args.comparison:
+        print(f"Comparison: {comparison_path}")
     print(f"Iconset: {iconset_dir}")
     print("\nTo create .icns:")
     print(f"  iconutil -c icns {iconset_dir}")